@@ -43,6 +43,7 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=22.1.0",
             "isort>=5.10.1",
             "flake8>=4.0.1",
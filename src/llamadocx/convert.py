@@ -10,8 +10,9 @@ import re
 import logging
 import subprocess
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union, List, Dict, Any, Tuple
+from typing import Optional, Union, List, Dict, Any, Tuple, FrozenSet
 
 from docx import Document
 from docx.oxml.ns import qn
@@ -267,8 +268,12 @@ def get_pandoc_version() -> Optional[str]:
         return None
 
 
-def get_supported_formats() -> tuple:
-    """Get lists of supported input and output formats.
+@lru_cache(maxsize=None)
+def get_supported_formats() -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Get sets of supported input and output formats.
+
+    The formats are probed once (querying pandoc when available) and the
+    result is cached for the lifetime of the process.
 
     Returns:
         Tuple of (input_formats, output_formats)
@@ -281,11 +286,11 @@ def get_supported_formats() -> tuple:
     if has_pandoc():
         try:
             import pypandoc
-            return (pypandoc.get_pandoc_formats()[0], pypandoc.get_pandoc_formats()[1])
+            input_formats, output_formats = pypandoc.get_pandoc_formats()
         except Exception:
             pass
     
-    return (input_formats, output_formats)
+    return (frozenset(input_formats), frozenset(output_formats))
 
 
 def md_to_docx(
@@ -0,0 +1,66 @@
+"""
+Shared pytest fixtures for LlamaDocx tests.
+"""
+
+import io
+import re
+from functools import lru_cache
+
+import pytest
+from docx import Document
+
+
+@lru_cache(maxsize=64)
+def _scanner(needles):
+    """Build a multi-pattern matcher for a tuple of needles.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed and
+    falls back to a compiled regex alternation otherwise.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        # Longest needles first so overlapping prefixes still match in full
+        ordered = sorted(needles, key=len, reverse=True)
+        return re.compile('|'.join(map(re.escape, ordered)))
+
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return automaton
+
+
+def _find_all(haystack, needles):
+    """Return the set of needles found in haystack in a single scan."""
+    scanner = _scanner(needles)
+    if isinstance(scanner, re.Pattern):
+        found = {match.group(0) for match in scanner.finditer(haystack)}
+        # Non-overlapping regex matches can hide needles nested in others
+        return found | {n for n in needles if n not in found and n in haystack}
+    return {value for _, value in scanner.iter(haystack)}
+
+
+@pytest.fixture
+def assert_contains_all():
+    """Assert that every given needle occurs in a text."""
+    def _assert_contains_all(haystack, *needles):
+        found = _find_all(haystack, needles)
+        missing = [n for n in needles if n not in found]
+        assert not missing, f"Missing from text: {missing}"
+    return _assert_contains_all
+
+
+def _roundtrip(doc):
+    """Save doc to memory and load it back."""
+    buf = io.BytesIO()
+    doc.save(buf)
+    buf.seek(0)
+    return Document(buf)
+
+
+@pytest.fixture
+def roundtrip():
+    """Save a document to memory and load it back."""
+    return _roundtrip
+
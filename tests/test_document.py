@@ -76,12 +76,11 @@ def test_save_document(tmp_path):
     assert "Test Save" in text
 
 
-def test_get_text(temp_doc):
+def test_get_text(temp_doc, assert_contains_all):
     """Test extracting text from a document."""
     doc = Document(temp_doc)
     text = doc.get_text()
-    assert "Test Document" in text
-    assert "This is a test paragraph." in text
+    assert_contains_all(text, "Test Document", "This is a test paragraph.")
 
 
 def test_document_properties(temp_doc):
@@ -4,8 +4,9 @@ Hyperlinks tests for LlamaDocx.
 This module contains tests for the hyperlink functionality of the LlamaDocx package.
 """
 
+import io
 import os
-import tempfile
+from urllib.parse import parse_qs, urlparse
 import pytest
 from docx import Document
 
@@ -23,84 +24,95 @@ from llamadocx.hyperlinks import (
 )
 
 
+# Re-check read-only results on a saved and reloaded copy (set in CI)
+_PERSIST = os.environ.get("LLAMADOCX_FULL_PERSISTENCE") == "1"
+
+# Text expected in the paragraph holding two hyperlinks
+MULTI_LINK_TEXT = (
+    "This paragraph contains",
+    "first link",
+    "second link",
+    "in the same paragraph",
+)
+
+
+@pytest.fixture(scope="session")
+def sample_bytes():
+    """Build the sample document once and return its serialized bytes."""
+    doc = Document()
+    
+    # Add heading
+    doc.add_heading('Hyperlinks Test Document', level=1)
+    
+    # Add paragraphs
+    doc.add_paragraph('This is a paragraph for testing external hyperlinks.')
+    doc.add_paragraph('This is a paragraph for testing internal hyperlinks.')
+    doc.add_paragraph('This is a paragraph for testing email hyperlinks.')
+    
+    # Serialize the document
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
 @pytest.fixture
-def sample_document():
+def sample_document(sample_bytes):
     """Create a sample document for testing hyperlinks."""
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        doc = Document()
-        
-        # Add heading
-        doc.add_heading('Hyperlinks Test Document', level=1)
-        
-        # Add paragraphs
-        doc.add_paragraph('This is a paragraph for testing external hyperlinks.')
-        doc.add_paragraph('This is a paragraph for testing internal hyperlinks.')
-        doc.add_paragraph('This is a paragraph for testing email hyperlinks.')
-        
-        # Save the document
-        doc.save(tmp.name)
-        
-    yield tmp.name
-    
-    # Clean up
-    os.unlink(tmp.name)
+    return Document(io.BytesIO(sample_bytes))
+
+
+@pytest.fixture
+def maybe_reload(roundtrip):
+    """Return doc, or a saved and reloaded copy of it when _PERSIST is set."""
+    def _maybe_reload(doc):
+        return roundtrip(doc) if _PERSIST else doc
+    return _maybe_reload
+
 
+def _by_url(doc):
+    """Map each hyperlink's URL to the hyperlink, resolving every URL once."""
+    return {get_hyperlink_url(link): link for link in get_hyperlinks(doc)}
 
-def test_add_hyperlink(sample_document):
-    """Test adding an external hyperlink to a document."""
-    # Load the document
-    doc = Document(sample_document)
+
+@pytest.mark.parametrize("url,text", [
+    pytest.param("https://www.example.com", "Example Website", id="simple"),
+    pytest.param("https://www.example.com/search?q=test&category=docs#section2",
+                 "Complex Link", id="query-and-fragment"),
+])
+def test_add_hyperlink(sample_document, url, text, roundtrip):
+    """Test adding an external hyperlink, with or without query and fragment."""
+    doc = sample_document
     
     # Add a hyperlink to paragraph 1
     paragraph = doc.paragraphs[1]
-    url = "https://www.example.com"
-    text = "Example Website"
     hyperlink = add_hyperlink(doc, paragraph, url, text)
     
     # Verify hyperlink was created
     assert hyperlink is not None
     
     # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Get all hyperlinks
-        hyperlinks = get_hyperlinks(doc2)
-        
-        # Verify hyperlink exists
-        assert len(hyperlinks) >= 1
-        
-        # Verify hyperlink properties
-        hyperlink_found = False
-        for link in hyperlinks:
-            if get_hyperlink_url(link) == url:
-                hyperlink_found = True
-                assert text in link.text
-                break
-                
-        assert hyperlink_found, "Added hyperlink not found in document"
-    finally:
-        # Clean up
-        os.unlink(output_path)
+    doc2 = roundtrip(doc)
+    
+    # Get all hyperlinks by URL
+    links = _by_url(doc2)
+    
+    # Verify hyperlink exists and its properties
+    assert url in links, "Added hyperlink not found in document"
+    assert text in links[url].text
 
 
-def test_add_internal_hyperlink(sample_document):
+def test_add_internal_hyperlink(sample_document, roundtrip):
     """Test adding an internal hyperlink (bookmark) to a document."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
+    paras = doc.paragraphs
     
     # Add a bookmark
-    paragraph = doc.paragraphs[2]
+    paragraph = paras[2]
     bookmark_name = "test_bookmark"
     bookmark = add_bookmark(doc, paragraph, bookmark_name)
     
     # Add an internal hyperlink to the bookmark
-    link_paragraph = doc.paragraphs[1]
+    link_paragraph = paras[1]
     link_text = "Jump to bookmark"
     internal_link = add_internal_hyperlink(doc, link_paragraph, bookmark_name, link_text)
     
@@ -108,43 +120,25 @@ def test_add_internal_hyperlink(sample_document):
     assert internal_link is not None
     
     # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Get all hyperlinks
-        hyperlinks = get_hyperlinks(doc2)
-        
-        # Verify hyperlink exists
-        assert len(hyperlinks) >= 1
-        
-        # Verify bookmark exists
-        bookmarks = get_bookmarks(doc2)
-        assert bookmark_name in bookmarks
-        
-        # Verify link to bookmark
-        link_found = False
-        for link in hyperlinks:
-            url = get_hyperlink_url(link)
-            if url and bookmark_name in url:
-                link_found = True
-                assert link_text in link.text
-                break
-                
-        assert link_found, "Internal hyperlink not found"
-    finally:
-        # Clean up
-        os.unlink(output_path)
+    doc2 = roundtrip(doc)
+    
+    # Get all hyperlinks by URL
+    links = _by_url(doc2)
+    
+    # Verify bookmark exists
+    bookmarks = get_bookmarks(doc2)
+    assert bookmark_name in bookmarks
+    
+    # Verify link to bookmark
+    link = next((candidate for url, candidate in links.items()
+                 if url and bookmark_name in url), None)
+    assert link is not None, "Internal hyperlink not found"
+    assert link_text in link.text
 
 
-def test_add_email_hyperlink(sample_document):
+def test_add_email_hyperlink(sample_document, roundtrip):
     """Test adding an email hyperlink to a document."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Add an email hyperlink
     paragraph = doc.paragraphs[3]
@@ -157,38 +151,23 @@ def test_add_email_hyperlink(sample_document):
     assert email_link is not None
     
     # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Get all hyperlinks
-        hyperlinks = get_hyperlinks(doc2)
-        
-        # Verify email hyperlink exists
-        link_found = False
-        for link in hyperlinks:
-            url = get_hyperlink_url(link)
-            if url and url.startswith("mailto:") and email in url:
-                link_found = True
-                assert text in link.text
-                if subject:
-                    assert "subject=" in url
-                break
-                
-        assert link_found, "Email hyperlink not found"
-    finally:
-        # Clean up
-        os.unlink(output_path)
+    doc2 = roundtrip(doc)
+    
+    # Get all hyperlinks by URL
+    links = _by_url(doc2)
+    
+    # Verify email hyperlink exists
+    parsed = {url: urlparse(url) for url in links if url}
+    url = next((u for u, parts in parsed.items()
+                if parts.scheme == "mailto" and parts.path == email), None)
+    assert url is not None, "Email hyperlink not found"
+    assert text in links[url].text
+    assert parse_qs(parsed[url].query).get("subject") == [subject]
 
 
-def test_update_hyperlink(sample_document):
+def test_update_hyperlink(sample_document, roundtrip):
     """Test updating an existing hyperlink."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Add a hyperlink first
     paragraph = doc.paragraphs[1]
@@ -196,16 +175,8 @@ def test_update_hyperlink(sample_document):
     original_text = "Original Link"
     hyperlink = add_hyperlink(doc, paragraph, original_url, original_text)
     
-    # Get hyperlinks
-    hyperlinks = get_hyperlinks(doc)
-    
     # Find the hyperlink we just added
-    link_to_update = None
-    for link in hyperlinks:
-        if get_hyperlink_url(link) == original_url:
-            link_to_update = link
-            break
-    
+    link_to_update = _by_url(doc).get(original_url)
     assert link_to_update is not None
     
     # Update the hyperlink
@@ -217,60 +188,33 @@ def test_update_hyperlink(sample_document):
     assert update_result is True
     
     # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Get all hyperlinks
-        hyperlinks = get_hyperlinks(doc2)
-        
-        # Verify updated hyperlink exists
-        updated_link_found = False
-        original_link_found = False
-        
-        for link in hyperlinks:
-            url = get_hyperlink_url(link)
-            if url == new_url:
-                updated_link_found = True
-                assert new_text in link.text
-            elif url == original_url:
-                original_link_found = True
-        
-        assert updated_link_found, "Updated hyperlink not found"
-        assert not original_link_found, "Original hyperlink still exists"
-    finally:
-        # Clean up
-        os.unlink(output_path)
+    doc2 = roundtrip(doc)
+    
+    # Get all hyperlinks by URL
+    links = _by_url(doc2)
+    
+    # Verify updated hyperlink exists and the original is gone
+    assert new_url in links, "Updated hyperlink not found"
+    assert new_text in links[new_url].text
+    assert original_url not in links, "Original hyperlink still exists"
 
 
-def test_remove_hyperlink(sample_document):
+def test_remove_hyperlink(sample_document, roundtrip):
     """Test removing a hyperlink from a document."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
+    paras = doc.paragraphs
     
     # Add multiple hyperlinks
-    paragraph1 = doc.paragraphs[1]
+    paragraph1 = paras[1]
     url1 = "https://www.example1.com"
     hyperlink1 = add_hyperlink(doc, paragraph1, url1, "Link 1")
     
-    paragraph2 = doc.paragraphs[2]
+    paragraph2 = paras[2]
     url2 = "https://www.example2.com"
     hyperlink2 = add_hyperlink(doc, paragraph2, url2, "Link 2")
     
-    # Get all hyperlinks
-    hyperlinks = get_hyperlinks(doc)
-    
     # Find the first hyperlink
-    link_to_remove = None
-    for link in hyperlinks:
-        if get_hyperlink_url(link) == url1:
-            link_to_remove = link
-            break
-    
+    link_to_remove = _by_url(doc).get(url1)
     assert link_to_remove is not None
     
     # Remove the first hyperlink
@@ -279,62 +223,35 @@ def test_remove_hyperlink(sample_document):
     # Verify removal was successful
     assert remove_result is True
     
-    # Get remaining hyperlinks
-    remaining_hyperlinks = get_hyperlinks(doc)
+    # Get remaining hyperlinks by URL
+    remaining = _by_url(doc)
     
-    # Verify first hyperlink was removed
-    for link in remaining_hyperlinks:
-        assert get_hyperlink_url(link) != url1
+    # Verify first hyperlink was removed and the second still exists
+    assert url1 not in remaining
+    assert url2 in remaining, "Second hyperlink should still exist"
     
-    # Verify second hyperlink still exists
-    second_link_found = False
-    for link in remaining_hyperlinks:
-        if get_hyperlink_url(link) == url2:
-            second_link_found = True
-            break
+    # Save and reload to verify persistence
+    doc2 = roundtrip(doc)
     
-    assert second_link_found, "Second hyperlink should still exist"
+    # Get all hyperlinks by URL
+    links = _by_url(doc2)
     
-    # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Get all hyperlinks
-        hyperlinks = get_hyperlinks(doc2)
-        
-        # Verify first hyperlink was removed
-        for link in hyperlinks:
-            assert get_hyperlink_url(link) != url1
-        
-        # Verify second hyperlink still exists
-        second_link_found = False
-        for link in hyperlinks:
-            if get_hyperlink_url(link) == url2:
-                second_link_found = True
-                break
-        
-        assert second_link_found, "Second hyperlink should still exist"
-    finally:
-        # Clean up
-        os.unlink(output_path)
+    # Verify first hyperlink was removed and the second still exists
+    assert url1 not in links
+    assert url2 in links, "Second hyperlink should still exist"
 
 
-def test_bookmarks(sample_document):
+def test_bookmarks(sample_document, maybe_reload):
     """Test adding, retrieving, and removing bookmarks."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
+    paras = doc.paragraphs
     
     # Add multiple bookmarks
-    paragraph1 = doc.paragraphs[1]
+    paragraph1 = paras[1]
     bookmark1_name = "bookmark1"
     bookmark1 = add_bookmark(doc, paragraph1, bookmark1_name)
     
-    paragraph2 = doc.paragraphs[2]
+    paragraph2 = paras[2]
     bookmark2_name = "bookmark2"
     bookmark2 = add_bookmark(doc, paragraph2, bookmark2_name)
     
@@ -364,75 +281,22 @@ def test_bookmarks(sample_document):
     # Verify second bookmark still exists
     assert bookmark2_name in remaining_bookmarks
     
-    # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Get all bookmarks
-        bookmarks = get_bookmarks(doc2)
-        
-        # Verify first bookmark was removed
-        assert bookmark1_name not in bookmarks
-        
-        # Verify second bookmark still exists
-        assert bookmark2_name in bookmarks
-    finally:
-        # Clean up
-        os.unlink(output_path)
-
-
-def test_complex_hyperlinks(sample_document):
-    """Test complex hyperlink scenarios with parameters and fragments."""
-    # Load the document
-    doc = Document(sample_document)
+    # Save and reload to verify persistence in full runs
+    doc2 = maybe_reload(doc)
     
-    # Add complex URL with query parameters and fragment
-    paragraph = doc.paragraphs[1]
-    complex_url = "https://www.example.com/search?q=test&category=docs#section2"
-    text = "Complex Link"
-    complex_link = add_hyperlink(doc, paragraph, complex_url, text)
+    # Get all bookmarks
+    bookmarks = get_bookmarks(doc2)
     
-    # Verify link was created
-    assert complex_link is not None
+    # Verify first bookmark was removed
+    assert bookmark1_name not in bookmarks
     
-    # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Get all hyperlinks
-        hyperlinks = get_hyperlinks(doc2)
-        
-        # Verify complex hyperlink exists with all components
-        complex_link_found = False
-        for link in hyperlinks:
-            url = get_hyperlink_url(link)
-            if url and url == complex_url:
-                complex_link_found = True
-                assert text in link.text
-                assert "q=test" in url
-                assert "#section2" in url
-                break
-                
-        assert complex_link_found, "Complex hyperlink not found or parameters missing"
-    finally:
-        # Clean up
-        os.unlink(output_path)
+    # Verify second bookmark still exists
+    assert bookmark2_name in bookmarks
 
 
-def test_multiple_hyperlinks_in_paragraph(sample_document):
+def test_multiple_hyperlinks_in_paragraph(sample_document, assert_contains_all, maybe_reload):
     """Test adding multiple hyperlinks to a single paragraph."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Get a paragraph
     paragraph = doc.paragraphs[1]
@@ -451,32 +315,16 @@ def test_multiple_hyperlinks_in_paragraph(sample_document):
     assert link1 is not None
     assert link2 is not None
     
-    # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Get all hyperlinks
-        hyperlinks = get_hyperlinks(doc2)
-        
-        # Verify both hyperlinks exist
-        urls = [get_hyperlink_url(link) for link in hyperlinks]
-        assert "https://www.example1.com" in urls
-        assert "https://www.example2.com" in urls
-        
-        # Verify paragraph text contains both links
-        para_text = doc2.paragraphs[1].text
-        assert "first link" in para_text
-        assert "second link" in para_text
-        assert "This paragraph contains" in para_text
-        assert "in the same paragraph" in para_text
-    finally:
-        # Clean up
-        os.unlink(output_path)
+    # Save and reload to verify persistence in full runs
+    doc2 = maybe_reload(doc)
+    
+    # Verify both hyperlinks exist
+    links = _by_url(doc2)
+    assert "https://www.example1.com" in links
+    assert "https://www.example2.com" in links
+    
+    # Verify paragraph text contains both links
+    assert_contains_all(doc2.paragraphs[1].text, *MULTI_LINK_TEXT)
 
 
 if __name__ == '__main__':
@@ -4,8 +4,7 @@ Image tests for LlamaDocx.
 This module contains tests for the image handling functionality of the LlamaDocx package.
 """
 
-import os
-import tempfile
+import io
 from pathlib import Path
 import pytest
 from docx import Document
@@ -13,69 +12,105 @@ from docx import Document
 from llamadocx.image import Image, ImageProcessor
 
 
-# Create a very simple test image file
-def create_test_image(path, size=(100, 100)):
-    """Create a simple test image at the specified path."""
+_HAS_PIL = ImageProcessor.has_pil()
+
+
+@pytest.fixture(scope="session")
+def blank_bytes():
+    """Serialize python-docx's default template once per session."""
+    buf = io.BytesIO()
+    Document().save(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def blank_document(blank_bytes):
+    """Return a fresh, empty document.
+
+    ``Document()`` rereads the bundled default template from disk on every
+    call; loading the cached bytes instead is cheaper.
+    """
+    return Document(io.BytesIO(blank_bytes))
+
+
+@pytest.fixture(scope="session")
+def _png_bytes():
+    """Encode a simple test image once, or return None if PIL is missing."""
     try:
         from PIL import Image as PILImage
-        
-        # Create a simple RGB image
-        img = PILImage.new('RGB', size, color=(73, 109, 137))
-        img.save(path)
-        return True
     except ImportError:
-        # PIL not available, create an empty file
-        with open(path, 'wb') as f:
-            f.write(b'')
-        return False
+        return None
+    
+    # Create a simple RGB image
+    buf = io.BytesIO()
+    PILImage.new('RGB', (100, 100), color=(73, 109, 137)).save(buf, 'PNG')
+    return buf.getvalue()
 
 
 @pytest.fixture
-def temp_image():
+def temp_image(tmp_path, _png_bytes):
     """Create a temporary image file for testing."""
-    with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-        has_pil = create_test_image(tmp.name)
-        
-    yield tmp.name, has_pil
+    path = tmp_path / "image.png"
     
-    # Clean up
-    os.unlink(tmp.name)
+    # Without PIL, leave an empty file
+    path.write_bytes(_png_bytes or b'')
+    return str(path), _png_bytes is not None
 
 
 @pytest.fixture
-def temp_docx_with_image(temp_image):
-    """Create a temporary DOCX file with an embedded image for testing."""
+def processor(temp_image):
+    """Create an ImageProcessor for the temporary test image."""
+    image_path, _ = temp_image
+    return ImageProcessor(image_path)
+
+
+def _add_image_content(doc, image_path, has_image=True):
+    """Fill an empty document and embed the image at image_path.
+
+    Returns the filled document.
+    """
+    doc.add_heading('Document with Image', level=1)
+    doc.add_paragraph('This is a test document with an embedded image.')
+    
+    # Add the image to the document, unless it is only an empty placeholder
+    if has_image:
+        doc.add_picture(image_path, width=2000000, height=2000000)  # ~2 inches
+    return doc
+
+
+@pytest.fixture
+def temp_docx_with_image(temp_image, blank_document):
+    """Create an in-memory document with an embedded image for testing."""
     image_path, has_pil = temp_image
-    
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        doc = Document()
-        doc.add_heading('Document with Image', level=1)
-        doc.add_paragraph('This is a test document with an embedded image.')
-        
-        # Add the image to the document
-        if os.path.exists(image_path):
-            doc.add_picture(image_path, width=2000000, height=2000000)  # ~2 inches
-            
-        # Save the document
-        doc.save(tmp.name)
-        
-    yield tmp.name, has_pil
-    
-    # Clean up
-    os.unlink(tmp.name)
-
-
-def test_image_properties(temp_docx_with_image):
+    return _add_image_content(blank_document, image_path, has_pil)
+
+
+@pytest.fixture(scope="module")
+def temp_docx_with_image_ro(tmp_path_factory, _png_bytes, blank_bytes):
+    """Create a DOCX file with an embedded image once per module.
+    
+    Only for tests that load the file without writing it back; the
+    returned document is shared, so it must not be modified either.
+    """
+    tmp_dir = tmp_path_factory.mktemp("docx_with_image")
+    image_path = tmp_dir / "image.png"
+    image_path.write_bytes(_png_bytes or b'')
+    
+    docx_path = tmp_dir / "image.docx"
+    doc = _add_image_content(Document(io.BytesIO(blank_bytes)), str(image_path),
+                             _png_bytes is not None)
+    doc.save(str(docx_path))
+    return str(docx_path), _png_bytes is not None, doc
+
+
+def test_image_properties(temp_docx_with_image_ro):
     """Test basic Image class properties."""
-    docx_path, has_pil = temp_docx_with_image
+    _, has_pil, doc = temp_docx_with_image_ro
     
     # Skip test if we couldn't create a proper image
     if not has_pil:
         pytest.skip("PIL not available for image testing")
     
-    # Load the document and get the image
-    doc = Document(docx_path)
-    
     # Make sure we have an image
     assert len(doc.inline_shapes) > 0
     
@@ -88,15 +123,15 @@ def test_image_properties(temp_docx_with_image):
     assert image.aspect_ratio > 0
 
 
-def test_image_resize(temp_docx_with_image):
+def test_image_resize(temp_docx_with_image_ro):
     """Test Image resize functionality."""
-    docx_path, has_pil = temp_docx_with_image
+    docx_path, has_pil, _ = temp_docx_with_image_ro
     
     # Skip test if we couldn't create a proper image
     if not has_pil:
         pytest.skip("PIL not available for image testing")
     
-    # Load the document and get the image
+    # Load a private copy of the document, since resizing modifies it
     doc = Document(docx_path)
     
     # Make sure we have an image
@@ -131,14 +166,9 @@ def test_image_resize(temp_docx_with_image):
     assert image.height == original_height
 
 
-@pytest.mark.skipif(not ImageProcessor.has_pil(), reason="PIL not available")
-def test_image_processor_basic(temp_image):
+@pytest.mark.skipif(not _HAS_PIL, reason="PIL not available")
+def test_image_processor_basic(processor, tmp_path):
     """Test basic ImageProcessor functionality."""
-    image_path, _ = temp_image
-    
-    # Create a processor
-    processor = ImageProcessor(image_path)
-    
     # Test that the processor loaded the image
     assert processor.image is not None
     
@@ -153,26 +183,15 @@ def test_image_processor_basic(temp_image):
     assert rotated.height == resized.width
     
     # Test saving
-    with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-        output_path = tmp.name
-    
-    try:
-        processor.save(output_path)
-        assert os.path.exists(output_path)
-        assert os.path.getsize(output_path) > 0
-    finally:
-        if os.path.exists(output_path):
-            os.unlink(output_path)
+    output_path = tmp_path / "output.png"
+    processor.save(str(output_path))
+    assert output_path.exists()
+    assert output_path.stat().st_size > 0
 
 
-@pytest.mark.skipif(not ImageProcessor.has_pil(), reason="PIL not available")
-def test_image_processor_methods(temp_image):
+@pytest.mark.skipif(not _HAS_PIL, reason="PIL not available")
+def test_image_processor_methods(processor):
     """Test various ImageProcessor methods."""
-    image_path, _ = temp_image
-    
-    # Create a processor
-    processor = ImageProcessor(image_path)
-    
     # Test crop
     cropped = processor.crop(10, 10, 90, 90)
     assert cropped.width == 80
@@ -196,18 +215,12 @@ def test_image_processor_methods(temp_image):
     assert lower_contrast is not None
 
 
-def test_image_in_document(temp_docx_with_image, temp_image):
+@pytest.mark.skipif(not _HAS_PIL, reason="PIL not available")
+def test_image_in_document(temp_docx_with_image, temp_image, roundtrip):
     """Test adding and manipulating images in a document."""
-    docx_path, has_pil = temp_docx_with_image
+    doc = temp_docx_with_image
     image_path, _ = temp_image
     
-    # Skip test if we couldn't create a proper image
-    if not has_pil or not ImageProcessor.has_pil():
-        pytest.skip("PIL not available for image testing")
-    
-    # Load the document
-    doc = Document(docx_path)
-    
     # Count initial images
     initial_image_count = len(doc.inline_shapes)
     
@@ -230,23 +243,13 @@ def test_image_in_document(temp_docx_with_image, temp_image):
     assert image.width == new_width
     assert image.height == new_height
     
-    # Save the document with the modified image
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
+    # Save and reload the document and check image dimensions
+    doc2 = roundtrip(doc)
+    assert len(doc2.inline_shapes) == initial_image_count + 1
     
-    try:
-        doc.save(output_path)
-        
-        # Reload the document and check image dimensions
-        doc2 = Document(output_path)
-        assert len(doc2.inline_shapes) == initial_image_count + 1
-        
-        image2 = Image(doc2.inline_shapes[-1])
-        assert image2.width == new_width
-        assert image2.height == new_height
-    finally:
-        if os.path.exists(output_path):
-            os.unlink(output_path)
+    image2 = Image(doc2.inline_shapes[-1])
+    assert image2.width == new_width
+    assert image2.height == new_height
 
 
 if __name__ == '__main__':
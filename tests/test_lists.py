@@ -4,8 +4,8 @@ Lists tests for LlamaDocx.
 This module contains tests for the list handling functionality of the LlamaDocx package.
 """
 
-import os
-import tempfile
+import io
+import zipfile
 import pytest
 from docx import Document
 from docx.enum.style import WD_STYLE_TYPE
@@ -24,98 +24,52 @@ from llamadocx.lists import (
 )
 
 
+@pytest.fixture(scope="session")
+def sample_bytes():
+    """Build the sample document once and return its serialized bytes."""
+    doc = Document()
+    
+    # Add heading
+    doc.add_heading('Lists Test Document', level=1)
+    
+    # Add content
+    doc.add_paragraph('This document is used for testing list functionality.')
+    
+    # Serialize the document
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
 @pytest.fixture
-def sample_document():
+def sample_document(sample_bytes):
     """Create a sample document for testing lists."""
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        doc = Document()
-        
-        # Add heading
-        doc.add_heading('Lists Test Document', level=1)
-        
-        # Add content
-        doc.add_paragraph('This document is used for testing list functionality.')
-        
-        # Save the document
-        doc.save(tmp.name)
-        
-    yield tmp.name
-    
-    # Clean up
-    os.unlink(tmp.name)
+    return Document(io.BytesIO(sample_bytes))
 
 
-def test_add_bullet_list(sample_document):
-    """Test creating a simple bullet list."""
-    # Load the document
-    doc = Document(sample_document)
-    
-    # Create a bullet list
-    items = ['First bullet item', 'Second bullet item', 'Third bullet item']
-    list_paragraphs = add_bullet_list(doc, items)
-    
-    # Verify list was created with correct items
-    assert len(list_paragraphs) == len(items)
-    for i, paragraph in enumerate(list_paragraphs):
-        assert items[i] in paragraph.text
-    
-    # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Verify list paragraphs exist
-        # Note: we can't easily check for bullet formatting directly in python-docx
-        for i, text in enumerate(items):
-            assert text in doc2.paragraphs[i+2].text  # +2 for heading and intro paragraph
-    finally:
-        # Clean up
-        os.unlink(output_path)
+def _saved_document_xml(doc):
+    """Save doc to memory and return its word/document.xml part as text."""
+    buf = io.BytesIO()
+    doc.save(buf)
+    with zipfile.ZipFile(buf) as package:
+        return package.read('word/document.xml').decode('utf-8')
 
 
-def test_add_numbered_list(sample_document):
-    """Test creating a numbered list."""
-    # Load the document
-    doc = Document(sample_document)
-    
-    # Create a numbered list
-    items = ['First numbered item', 'Second numbered item', 'Third numbered item']
-    list_paragraphs = add_numbered_list(doc, items)
-    
-    # Verify list was created with correct items
-    assert len(list_paragraphs) == len(items)
-    for i, paragraph in enumerate(list_paragraphs):
-        assert items[i] in paragraph.text
-    
-    # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Verify list paragraphs exist
-        # Note: we can't easily check for number formatting directly in python-docx
-        for i, text in enumerate(items):
-            assert text in doc2.paragraphs[i+2].text  # +2 for heading and intro paragraph
-    finally:
-        # Clean up
-        os.unlink(output_path)
+def _assert_texts(doc, start, expected):
+    """Assert that each expected text occurs in the paragraphs from start on."""
+    actual = [p.text for p in doc.paragraphs[start:start + len(expected)]]
+    assert len(actual) == len(expected) and all(
+        e in a for e, a in zip(expected, actual)), (expected, actual)
 
 
-def test_add_multilevel_list(sample_document):
-    """Test creating a multilevel list."""
-    # Load the document
-    doc = Document(sample_document)
-    
-    # Create a multilevel list structure
-    items = [
+@pytest.mark.parametrize("builder,items", [
+    pytest.param(add_bullet_list,
+                 ['First bullet item', 'Second bullet item', 'Third bullet item'],
+                 id="bullet"),
+    pytest.param(add_numbered_list,
+                 ['First numbered item', 'Second numbered item', 'Third numbered item'],
+                 id="numbered"),
+    pytest.param(add_multilevel_list, [
         ('First level item 1', 0),
         ('Second level item 1.1', 1),
         ('Second level item 1.2', 1),
@@ -123,37 +77,28 @@ def test_add_multilevel_list(sample_document):
         ('Second level item 2.1', 1),
         ('Third level item 2.1.1', 2),
         ('First level item 3', 0)
-    ]
-    
-    list_paragraphs = add_multilevel_list(doc, items)
+    ], id="multilevel"),
+])
+def test_add_list(sample_document, builder, items):
+    """Test creating bullet, numbered and multilevel lists."""
+    doc = sample_document
     
-    # Verify list was created with correct items and levels
-    assert len(list_paragraphs) == len(items)
-    for i, paragraph in enumerate(list_paragraphs):
-        assert items[i][0] in paragraph.text
-        # Note: level is harder to verify directly in python-docx
+    # Create the list
+    list_paragraphs = builder(doc, items)
     
-    # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
+    # Multilevel items are (text, level) pairs
+    texts = [item[0] if isinstance(item, tuple) else item for item in items]
     
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Verify list paragraphs exist
-        for i, (text, _) in enumerate(items):
-            assert text in doc2.paragraphs[i+2].text  # +2 for heading and intro paragraph
-    finally:
-        # Clean up
-        os.unlink(output_path)
+    # Verify list was created with correct items
+    # Note: level is harder to verify directly in python-docx
+    assert len(list_paragraphs) == len(texts)
+    for i, paragraph in enumerate(list_paragraphs):
+        assert texts[i] in paragraph.text
 
 
 def test_add_list_item(sample_document):
     """Test adding individual list items."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Create a list with individual items
     first_item = add_list_item(doc, 'First item', level=0, list_type='bullet')
@@ -170,29 +115,12 @@ def test_add_list_item(sample_document):
     assert 'Second item' in second_item.text
     assert 'Sub-item' in sub_item.text
     assert 'Third item' in third_item.text
-    
-    # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Verify list paragraphs exist
-        list_texts = ['First item', 'Second item', 'Sub-item', 'Third item']
-        for i, text in enumerate(list_texts):
-            assert text in doc2.paragraphs[i+2].text  # +2 for heading and intro paragraph
-    finally:
-        # Clean up
-        os.unlink(output_path)
 
 
-def test_create_list_style(sample_document):
+@pytest.mark.slow
+def test_create_list_style(sample_document, roundtrip):
     """Test creating a custom list style."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Create a custom list style
     style_name = 'CustomListStyle'
@@ -214,31 +142,19 @@ def test_create_list_style(sample_document):
         apply_list_style(paragraph, style_name)
     
     # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
+    doc2 = roundtrip(doc)
     
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Verify list style exists
-        list_styles = get_list_styles(doc2)
-        style_names = [style.name for style in list_styles if style is not None]
-        assert style_name in style_names
-        
-        # Verify list paragraphs exist with content
-        for i, text in enumerate(items):
-            assert text in doc2.paragraphs[i+2].text  # +2 for heading and intro paragraph
-    finally:
-        # Clean up
-        os.unlink(output_path)
+    # Verify list style exists
+    list_styles = get_list_styles(doc2)
+    assert any(style is not None and style.name == style_name for style in list_styles)
+    
+    # Verify list paragraphs exist with content
+    _assert_texts(doc2, 2, items)  # 2 skips heading and intro paragraph
 
 
-def test_set_list_level(sample_document):
+def test_set_list_level(sample_document, assert_contains_all):
     """Test changing the level of list items."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Create a list
     items = ['First item', 'Second item', 'Third item', 'Fourth item']
@@ -248,29 +164,15 @@ def test_set_list_level(sample_document):
     set_list_level(list_paragraphs[1], 1)  # Second item to level 1
     set_list_level(list_paragraphs[2], 2)  # Third item to level 2
     
-    # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
+    # Save and verify the list text persisted
+    assert_contains_all(_saved_document_xml(doc), *items)
         
-        # Verify list paragraphs exist with content
-        for i, text in enumerate(items):
-            assert text in doc2.paragraphs[i+2].text  # +2 for heading and intro paragraph
-            
-        # Unfortunately, we can't easily verify the level directly with python-docx
-    finally:
-        # Clean up
-        os.unlink(output_path)
+    # Unfortunately, we can't easily verify the level directly with python-docx
 
 
-def test_reset_list_numbering(sample_document):
+def test_reset_list_numbering(sample_document, assert_contains_all):
     """Test resetting list numbering."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Create first numbered list
     items1 = ['First list item 1', 'First list item 2', 'First list item 3']
@@ -286,30 +188,16 @@ def test_reset_list_numbering(sample_document):
     # Reset numbering for the second list
     reset_list_numbering(list_paragraphs2[0])
     
-    # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
+    # Save and verify all paragraphs persisted
+    paragraph_texts = items1 + ['This paragraph separates the two lists.'] + items2
     
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Verify all paragraphs exist
-        paragraph_texts = items1 + ['This paragraph separates the two lists.'] + items2
-        
-        # Check content (numbering reset is difficult to verify directly)
-        for i, text in enumerate(paragraph_texts):
-            assert text in doc2.paragraphs[i+2].text  # +2 for heading and intro paragraph
-    finally:
-        # Clean up
-        os.unlink(output_path)
+    # Check content (numbering reset is difficult to verify directly)
+    assert_contains_all(_saved_document_xml(doc), *paragraph_texts)
 
 
 def test_mixed_list_types(sample_document):
     """Test creating mixed bullet and numbered lists."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Create a bullet list
     bullet_items = ['Bullet item 1', 'Bullet item 2', 'Bullet item 3']
@@ -322,30 +210,16 @@ def test_mixed_list_types(sample_document):
     numbered_items = ['Numbered item 1', 'Numbered item 2', 'Numbered item 3']
     numbered_paragraphs = add_numbered_list(doc, numbered_items)
     
-    # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
+    # Verify all paragraphs exist
+    paragraph_texts = bullet_items + ['This separates bullet and numbered lists.'] + numbered_items
     
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Verify all paragraphs exist
-        paragraph_texts = bullet_items + ['This separates bullet and numbered lists.'] + numbered_items
-        
-        # Check content
-        for i, text in enumerate(paragraph_texts):
-            assert text in doc2.paragraphs[i+2].text  # +2 for heading and intro paragraph
-    finally:
-        # Clean up
-        os.unlink(output_path)
+    # Check content
+    _assert_texts(doc, 2, paragraph_texts)  # 2 skips heading and intro paragraph
 
 
 def test_list_continuation(sample_document):
     """Test continuing a list after a non-list paragraph."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Create a numbered list
     items1 = ['First item', 'Second item', 'Third item']
@@ -358,24 +232,34 @@ def test_list_continuation(sample_document):
     next_item = add_list_item(doc, 'Fourth item', level=0, list_type='numbered', continue_previous=True)
     another_item = add_list_item(doc, 'Fifth item', level=0, list_type='numbered', continue_previous=True)
     
+    # Verify all paragraphs exist
+    all_items = items1 + ['This paragraph interrupts the list.', 'Fourth item', 'Fifth item']
+    
+    # Check content
+    _assert_texts(doc, 2, all_items)  # 2 skips heading and intro paragraph
+
+
+@pytest.mark.slow
+def test_save_reload_roundtrip(sample_document, roundtrip):
+    """Test that every kind of list survives a save and reload."""
+    doc = sample_document
+    
+    # Build one list of each kind
+    bullet_items = ['Bullet item 1', 'Bullet item 2']
+    add_bullet_list(doc, bullet_items)
+    numbered_items = ['Numbered item 1', 'Numbered item 2']
+    add_numbered_list(doc, numbered_items)
+    multilevel_items = [('Level item 1', 0), ('Level item 1.1', 1), ('Level item 1.1.1', 2)]
+    add_multilevel_list(doc, multilevel_items)
+    add_list_item(doc, 'Single item', level=0, list_type='bullet')
+    
     # Save and reload to verify persistence
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
+    doc2 = roundtrip(doc)
     
-    try:
-        # Load the saved document
-        doc2 = Document(output_path)
-        
-        # Verify all paragraphs exist
-        all_items = items1 + ['This paragraph interrupts the list.', 'Fourth item', 'Fifth item']
-        
-        # Check content
-        for i, text in enumerate(all_items):
-            assert text in doc2.paragraphs[i+2].text  # +2 for heading and intro paragraph
-    finally:
-        # Clean up
-        os.unlink(output_path)
+    # Verify all list paragraphs exist
+    paragraph_texts = (bullet_items + numbered_items
+                       + [text for text, _ in multilevel_items] + ['Single item'])
+    _assert_texts(doc2, 2, paragraph_texts)  # 2 skips heading and intro paragraph
 
 
 if __name__ == '__main__':
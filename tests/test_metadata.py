@@ -4,10 +4,10 @@ Metadata tests for LlamaDocx.
 This module contains tests for the metadata handling functionality of the LlamaDocx package.
 """
 
-import os
+import io
 import json
-import tempfile
-from datetime import datetime
+import sys
+from datetime import datetime, timedelta
 from pathlib import Path
 import pytest
 from docx import Document
@@ -19,32 +19,42 @@ from llamadocx.metadata import (
 )
 
 
-@pytest.fixture
-def temp_docx():
-    """Create a temporary DOCX file for testing metadata."""
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        doc = Document()
-        doc.add_heading('Metadata Test Document', level=1)
-        doc.add_paragraph('This is a test document for metadata operations.')
-        
-        # Set some initial metadata
-        core_props = doc.core_properties
-        core_props.title = "Initial Title"
-        core_props.author = "Initial Author"
-        
-        # Save the document
-        doc.save(tmp.name)
-        
-    yield tmp.name
+# datetime.fromisoformat accepts a trailing 'Z' from Python 3.11 on
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(value):
+        """Parse an ISO 8601 timestamp that may end in 'Z'."""
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+@pytest.fixture(scope="session")
+def sample_bytes():
+    """Build the metadata sample document once and return its serialized bytes."""
+    doc = Document()
+    doc.add_heading('Metadata Test Document', level=1)
+    doc.add_paragraph('This is a test document for metadata operations.')
+    
+    # Set some initial metadata
+    core_props = doc.core_properties
+    core_props.title = "Initial Title"
+    core_props.author = "Initial Author"
     
-    # Clean up
-    os.unlink(tmp.name)
+    # Serialize the document
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def sample_document(sample_bytes):
+    """Create a sample document for testing metadata."""
+    return Document(io.BytesIO(sample_bytes))
 
 
-def test_get_metadata(temp_docx):
+def test_get_metadata(sample_document):
     """Test retrieving document metadata."""
-    # Load the document
-    doc = Document(temp_docx)
+    doc = sample_document
     
     # Get metadata
     metadata = get_metadata(doc)
@@ -61,94 +71,117 @@ def test_get_metadata(temp_docx):
     assert 'modified' in metadata
 
 
-def test_set_metadata(temp_docx):
-    """Test setting document metadata with a dictionary."""
-    # Prepare test metadata
-    test_metadata = {
+def _set_bulk(doc):
+    """Set document metadata with a dictionary."""
+    set_metadata(doc, {
         'title': 'Updated Title',
         'author': 'Updated Author',
         'subject': 'Metadata Testing',
         'keywords': 'test,metadata,python',
         'category': 'Testing',
         'comments': 'This is a test comment'
-    }
-    
-    # Load the document
-    doc = Document(temp_docx)
-    
-    # Set metadata
-    set_metadata(doc, test_metadata)
-    doc.save(temp_docx)
-    
-    # Reload the document and check metadata
-    doc = Document(temp_docx)
-    metadata = get_metadata(doc)
-    
-    # Verify all fields were updated
-    for key, value in test_metadata.items():
-        assert metadata[key] == value
+    })
+    return doc
 
 
-def test_individual_metadata_setters(temp_docx):
-    """Test individual metadata setter functions."""
-    # Load the document
-    doc = Document(temp_docx)
-    
-    # Set metadata using individual functions
+def _set_individually(doc):
+    """Set document metadata using the individual setter functions."""
     set_title(doc, "Function Set Title")
     set_author(doc, "Function Set Author")
     set_subject(doc, "Function Set Subject")
     set_keywords(doc, "function,set,keywords")
     set_category(doc, "Function Tests")
     set_comments(doc, "Comment set via function")
+    return doc
+
+
+def _set_then_overwrite(doc):
+    """Set every field, then update only some of them."""
+    set_metadata(doc, {
+        'title': 'Initial Title',
+        'author': 'Initial Author',
+        'subject': 'Initial Subject',
+        'keywords': 'initial,keywords',
+        'category': 'Initial Category',
+        'comments': 'Initial comments'
+    })
     
-    # Save the document
-    doc.save(temp_docx)
+    # Now update only some fields
+    set_metadata(doc, {
+        'title': 'Updated Title',
+        'author': 'Updated Author'
+    })
+    return doc
+
+
+@pytest.mark.parametrize("apply,expected", [
+    pytest.param(_set_bulk, {
+        'title': 'Updated Title',
+        'author': 'Updated Author',
+        'subject': 'Metadata Testing',
+        'keywords': 'test,metadata,python',
+        'category': 'Testing',
+        'comments': 'This is a test comment'
+    }, id="bulk"),
+    pytest.param(_set_individually, {
+        'title': "Function Set Title",
+        'author': "Function Set Author",
+        'subject': "Function Set Subject",
+        'keywords': "function,set,keywords",
+        'category': "Function Tests",
+        'comments': "Comment set via function"
+    }, id="individual"),
+    # Updated fields take new values; the rest keep their original ones
+    pytest.param(_set_then_overwrite, {
+        'title': 'Updated Title',
+        'author': 'Updated Author',
+        'subject': 'Initial Subject',
+        'keywords': 'initial,keywords',
+        'category': 'Initial Category',
+        'comments': 'Initial comments'
+    }, id="overwrite"),
+])
+def test_metadata_setters_roundtrip(sample_document, apply, expected, roundtrip):
+    """Test that metadata set in bulk, field by field, or as an overwrite persists."""
+    # Set metadata
+    doc = apply(sample_document)
     
-    # Reload and verify
-    doc = Document(temp_docx)
+    # Save, reload and verify
+    doc = roundtrip(doc)
     metadata = get_metadata(doc)
     
-    assert metadata['title'] == "Function Set Title"
-    assert metadata['author'] == "Function Set Author"
-    assert metadata['subject'] == "Function Set Subject"
-    assert metadata['keywords'] == "function,set,keywords"
-    assert metadata['category'] == "Function Tests"
-    assert metadata['comments'] == "Comment set via function"
+    assert {key: metadata[key] for key in expected} == expected
 
 
-def test_datetime_metadata(temp_docx):
+def test_datetime_metadata(sample_document, roundtrip):
     """Test setting datetime metadata."""
-    # Load the document
-    doc = Document(temp_docx)
+    doc = sample_document
     
     # Set datetime values
     now = datetime.now()
-    yesterday = datetime(now.year, now.month, now.day - 1, 12, 0, 0)
+    yesterday = now - timedelta(days=1)
     
     set_created_time(doc, yesterday)
     set_last_modified_time(doc, now)
     
-    # Save the document
-    doc.save(temp_docx)
-    
-    # Reload and verify
-    doc = Document(temp_docx)
+    # Save, reload and verify
+    doc = roundtrip(doc)
     metadata = get_metadata(doc)
     
     # Datetime comparison can be tricky due to serialization/deserialization
     # We'll check that the dates are close to what we set
-    created_time = datetime.fromisoformat(metadata['created'].replace('Z', '+00:00'))
-    modified_time = datetime.fromisoformat(metadata['modified'].replace('Z', '+00:00'))
+    created_time = _parse_iso(metadata['created'])
+    modified_time = _parse_iso(metadata['modified'])
     
     assert created_time.date() == yesterday.date()
     assert modified_time.date() == now.date()
 
 
-def test_metadata_file_operations(temp_docx):
+@pytest.mark.slow
+def test_metadata_file_operations(sample_document, tmp_path, roundtrip):
     """Test extracting and updating metadata from/to files."""
     # First set some metadata to extract
-    doc = Document(temp_docx)
+    doc = sample_document
     
     test_metadata = {
         'title': 'File Operation Test',
@@ -159,91 +192,38 @@ def test_metadata_file_operations(temp_docx):
     }
     
     set_metadata(doc, test_metadata)
-    doc.save(temp_docx)
     
     # Extract metadata to a file
-    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as tmp:
-        json_path = tmp.name
-    
-    try:
-        # Extract to file
-        extract_metadata_to_file(doc, json_path)
-        
-        # Verify the file was created and contains valid JSON
-        assert os.path.exists(json_path)
-        
-        with open(json_path, 'r') as f:
-            extracted_data = json.load(f)
-        
-        # Verify extracted data matches what we set
-        for key, value in test_metadata.items():
-            assert extracted_data[key] == value
-            
-        # Now modify the JSON and update back to the document
-        extracted_data['title'] = 'Updated via JSON'
-        extracted_data['author'] = 'JSON Updater'
-        
-        with open(json_path, 'w') as f:
-            json.dump(extracted_data, f)
-            
-        # Update document from the modified JSON
-        update_metadata_from_file(doc, json_path)
-        doc.save(temp_docx)
-        
-        # Reload and verify
-        doc = Document(temp_docx)
-        metadata = get_metadata(doc)
-        
-        assert metadata['title'] == 'Updated via JSON'
-        assert metadata['author'] == 'JSON Updater'
-        assert metadata['subject'] == 'File Operations'  # Should be unchanged
-    finally:
-        # Clean up
-        if os.path.exists(json_path):
-            os.unlink(json_path)
-
-
-def test_metadata_overwrite(temp_docx):
-    """Test that metadata updates correctly overwrite existing values."""
-    # Set initial metadata
-    doc = Document(temp_docx)
-    
-    initial_metadata = {
-        'title': 'Initial Title',
-        'author': 'Initial Author',
-        'subject': 'Initial Subject',
-        'keywords': 'initial,keywords',
-        'category': 'Initial Category',
-        'comments': 'Initial comments'
-    }
+    json_path = tmp_path / "metadata.json"
+    extract_metadata_to_file(doc, json_path)
     
-    set_metadata(doc, initial_metadata)
-    doc.save(temp_docx)
+    # Verify the file was created and contains valid JSON
+    assert json_path.exists()
     
-    # Now update only some fields
-    doc = Document(temp_docx)
+    extracted_data = json.loads(json_path.read_text())
     
-    update_metadata = {
-        'title': 'Updated Title',
-        'author': 'Updated Author'
-    }
+    # Verify extracted data matches what we set
+    assert {key: extracted_data[key] for key in test_metadata} == test_metadata
+        
+    # Now modify the JSON and update back to the document
+    extracted_data['title'] = 'Updated via JSON'
+    extracted_data['author'] = 'JSON Updater'
     
-    set_metadata(doc, update_metadata)
-    doc.save(temp_docx)
+    json_path.write_text(json.dumps(extracted_data))
+        
+    # Update document from the modified JSON
+    update_metadata_from_file(doc, json_path)
     
-    # Reload and verify
-    doc = Document(temp_docx)
+    # Save, reload and verify
+    doc = roundtrip(doc)
     metadata = get_metadata(doc)
     
-    # Updated fields should have new values
-    assert metadata['title'] == 'Updated Title'
-    assert metadata['author'] == 'Updated Author'
-    
-    # Non-updated fields should retain their original values
-    assert metadata['subject'] == 'Initial Subject'
-    assert metadata['keywords'] == 'initial,keywords'
-    assert metadata['category'] == 'Initial Category'
-    assert metadata['comments'] == 'Initial comments'
+    expected = {
+        'title': 'Updated via JSON',
+        'author': 'JSON Updater',
+        'subject': 'File Operations'  # Should be unchanged
+    }
+    assert {key: metadata[key] for key in expected} == expected
 
 
 if __name__ == '__main__':
@@ -4,59 +4,77 @@ Search and Replace tests for LlamaDocx.
 This module contains tests for the search and replacement functionality of the LlamaDocx package.
 """
 
-import os
-import tempfile
-import re
+import io
 import pytest
 from docx import Document
 
 from llamadocx.search import search_text, replace_text, find_all_text
 
 
+# Regex patterns are shared as module constants so that repeated calls hit the
+# re module's compile cache; search_text and replace_text compile with their
+# own flags, so they take pattern strings rather than compiled re.Pattern objects
+EMAIL_PATTERN = r'\b\w+@\w+\b'
+EX_WORD_PATTERN = r'\bex\w*\b'
+TEST_WORD_PATTERN = r'\btest\w*\b'
+CURRENCY_PATTERN = r'\$\d+\.\d+'
+ITEM_NUMBER_PATTERN = r'item \d'
+
+
+@pytest.fixture(scope="session")
+def sample_bytes():
+    """Build the sample document once and return its serialized bytes."""
+    doc = Document()
+    
+    # Add heading
+    doc.add_heading('Sample Document for Search Testing', level=1)
+    
+    # Add paragraphs with searchable content
+    doc.add_paragraph('This is a sample paragraph with some text to search for.')
+    doc.add_paragraph('We need multiple instances of certain words to test the search functionality.')
+    doc.add_paragraph('For example, the word "example" appears multiple times in this example document.')
+    doc.add_paragraph('Case sensitivity testing: Example vs example vs EXAMPLE.')
+    
+    # Add paragraphs with special characters
+    doc.add_paragraph('Special characters: $100.00, 50%, @username, #hashtag.')
+    doc.add_paragraph('Punctuation: Hello, world! How are you? This is a test; it has various punctuation marks.')
+    
+    # Add a table with searchable content
+    table = doc.add_table(rows=3, cols=2)
+    table.style = 'Table Grid'
+    
+    table.cell(0, 0).text = 'Item'
+    table.cell(0, 1).text = 'Description'
+    
+    table.cell(1, 0).text = 'Item 1'
+    table.cell(1, 1).text = 'This is the first item in our example.'
+    
+    table.cell(2, 0).text = 'Item 2'
+    table.cell(2, 1).text = 'This is the second item in our example table.'
+    
+    # Serialize the document
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
 @pytest.fixture
-def sample_document():
+def sample_document(sample_bytes):
     """Create a sample document with searchable text."""
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        doc = Document()
-        
-        # Add heading
-        doc.add_heading('Sample Document for Search Testing', level=1)
-        
-        # Add paragraphs with searchable content
-        doc.add_paragraph('This is a sample paragraph with some text to search for.')
-        doc.add_paragraph('We need multiple instances of certain words to test the search functionality.')
-        doc.add_paragraph('For example, the word "example" appears multiple times in this example document.')
-        doc.add_paragraph('Case sensitivity testing: Example vs example vs EXAMPLE.')
-        
-        # Add paragraphs with special characters
-        doc.add_paragraph('Special characters: $100.00, 50%, @username, #hashtag.')
-        doc.add_paragraph('Punctuation: Hello, world! How are you? This is a test; it has various punctuation marks.')
-        
-        # Add a table with searchable content
-        table = doc.add_table(rows=3, cols=2)
-        table.style = 'Table Grid'
-        
-        table.cell(0, 0).text = 'Item'
-        table.cell(0, 1).text = 'Description'
-        
-        table.cell(1, 0).text = 'Item 1'
-        table.cell(1, 1).text = 'This is the first item in our example.'
-        
-        table.cell(2, 0).text = 'Item 2'
-        table.cell(2, 1).text = 'This is the second item in our example table.'
-        
-        # Save the document
-        doc.save(tmp.name)
-        
-    yield tmp.name
-    
-    # Clean up
-    os.unlink(tmp.name)
+    return Document(io.BytesIO(sample_bytes))
+
+
+def _contains(doc, needle, include_paragraphs=True):
+    """Return True as soon as needle is found in a paragraph or table cell."""
+    if include_paragraphs and any(needle in p.text for p in doc.paragraphs):
+        return True
+    return any(needle in cell.text
+               for table in doc.tables for row in table.rows for cell in row.cells)
 
 
 def test_search_text_simple(sample_document):
     """Test basic text search functionality."""
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Search for a word that appears multiple times
     results = search_text(doc, 'example')
@@ -74,7 +92,7 @@ def test_search_text_simple(sample_document):
 
 def test_search_text_case_sensitive(sample_document):
     """Test case-sensitive text search."""
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Search with case sensitivity
     lower_results = search_text(doc, 'example', case_sensitive=True)
@@ -92,17 +110,17 @@ def test_search_text_case_sensitive(sample_document):
 
 def test_search_text_with_regex(sample_document):
     """Test regex-based text search."""
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Search using regex pattern
-    results = search_text(doc, r'\b\w+@\w+\b', use_regex=True)
+    results = search_text(doc, EMAIL_PATTERN, use_regex=True)
     
     # Check that we find the email-like pattern
     assert len(results) == 1
     assert '@username' in results[0]['text']
     
     # Search for all words that start with 'ex'
-    ex_results = search_text(doc, r'\bex\w*\b', use_regex=True, case_sensitive=False)
+    ex_results = search_text(doc, EX_WORD_PATTERN, use_regex=True, case_sensitive=False)
     
     # There should be multiple matches
     assert len(ex_results) >= 4
@@ -110,7 +128,7 @@ def test_search_text_with_regex(sample_document):
 
 def test_search_text_in_tables(sample_document):
     """Test searching text within tables."""
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Search for text that appears in table cells
     results = search_text(doc, 'item', include_tables=True, case_sensitive=False)
@@ -125,7 +143,7 @@ def test_search_text_in_tables(sample_document):
 
 def test_find_all_text(sample_document):
     """Test the find_all_text function for counting occurrences."""
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Count occurrences of a word
     count = find_all_text(doc, 'example', case_sensitive=False)
@@ -134,14 +152,13 @@ def test_find_all_text(sample_document):
     assert count >= 4
     
     # Test with regex pattern
-    regex_count = find_all_text(doc, r'\btest\w*\b', use_regex=True, case_sensitive=False)
+    regex_count = find_all_text(doc, TEST_WORD_PATTERN, use_regex=True, case_sensitive=False)
     assert regex_count >= 2
 
 
-def test_replace_text_simple(sample_document):
+def test_replace_text_simple(sample_document, tmp_path):
     """Test basic text replacement."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Replace a specific term
     replacements = replace_text(doc, 'example', 'REPLACED')
@@ -150,30 +167,24 @@ def test_replace_text_simple(sample_document):
     assert replacements > 0
     
     # Save the modified document
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the modified document and check replacements
-        modified_doc = Document(output_path)
-        
-        # Original term should no longer be present
-        count = find_all_text(modified_doc, 'example', case_sensitive=True)
-        assert count == 0
-        
-        # Replacement term should be present
-        replaced_count = find_all_text(modified_doc, 'REPLACED', case_sensitive=True)
-        assert replaced_count == replacements
-    finally:
-        # Clean up
-        os.unlink(output_path)
-
-
-def test_replace_text_case_sensitive(sample_document):
+    output_path = str(tmp_path / "modified.docx")
+    doc.save(output_path)
+    
+    # Load the modified document and check replacements
+    modified_doc = Document(output_path)
+    
+    # Original term should no longer be present
+    count = find_all_text(modified_doc, 'example', case_sensitive=True)
+    assert count == 0
+    
+    # Replacement term should be present
+    replaced_count = find_all_text(modified_doc, 'REPLACED', case_sensitive=True)
+    assert replaced_count == replacements
+
+
+def test_replace_text_case_sensitive(sample_document, tmp_path):
     """Test case-sensitive text replacement."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Replace only capitalized instances
     replacements = replace_text(doc, 'Example', 'REPLACED', case_sensitive=True)
@@ -182,98 +193,76 @@ def test_replace_text_case_sensitive(sample_document):
     assert replacements > 0
     
     # Save the modified document
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the modified document and check replacements
-        modified_doc = Document(output_path)
-        
-        # Capitalized term should no longer be present
-        count = find_all_text(modified_doc, 'Example', case_sensitive=True)
-        assert count == 0
-        
-        # Lowercase instances should still be present
-        lower_count = find_all_text(modified_doc, 'example', case_sensitive=True)
-        assert lower_count > 0
-    finally:
-        # Clean up
-        os.unlink(output_path)
-
-
-def test_replace_text_with_regex(sample_document):
+    output_path = str(tmp_path / "modified.docx")
+    doc.save(output_path)
+    
+    # Load the modified document and check replacements
+    modified_doc = Document(output_path)
+    
+    # Capitalized term should no longer be present
+    count = find_all_text(modified_doc, 'Example', case_sensitive=True)
+    assert count == 0
+    
+    # Lowercase instances should still be present
+    lower_count = find_all_text(modified_doc, 'example', case_sensitive=True)
+    assert lower_count > 0
+
+
+def test_replace_text_with_regex(sample_document, tmp_path):
     """Test regex-based text replacement."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Replace all currency amounts using regex
-    pattern = r'\$\d+\.\d+'
-    replacements = replace_text(doc, pattern, '[AMOUNT]', use_regex=True)
+    replacements = replace_text(doc, CURRENCY_PATTERN, '[AMOUNT]', use_regex=True)
     
     # Check that replacements were made
     assert replacements > 0
     
     # Save the modified document
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the modified document and check replacements
-        modified_doc = Document(output_path)
-        
-        # Currency pattern should no longer be present
-        count = find_all_text(modified_doc, r'\$\d+\.\d+', use_regex=True)
-        assert count == 0
-        
-        # Replacement term should be present
-        replaced_count = find_all_text(modified_doc, '[AMOUNT]')
-        assert replaced_count == replacements
-    finally:
-        # Clean up
-        os.unlink(output_path)
-
-
-def test_replace_text_with_function(sample_document):
+    output_path = str(tmp_path / "modified.docx")
+    doc.save(output_path)
+    
+    # Load the modified document and check replacements
+    modified_doc = Document(output_path)
+    
+    # Currency pattern should no longer be present
+    count = find_all_text(modified_doc, CURRENCY_PATTERN, use_regex=True)
+    assert count == 0
+    
+    # Replacement term should be present
+    replaced_count = find_all_text(modified_doc, '[AMOUNT]')
+    assert replaced_count == replacements
+
+
+def test_replace_text_with_function(sample_document, tmp_path):
     """Test replacing text using a function."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Define a replacement function to uppercase matches
     def uppercase_match(match):
         return match.group(0).upper()
     
     # Replace "item" with its uppercase version
-    replacements = replace_text(doc, r'item \d', uppercase_match, use_regex=True)
+    replacements = replace_text(doc, ITEM_NUMBER_PATTERN, uppercase_match, use_regex=True)
     
     # Check that replacements were made
     assert replacements > 0
     
     # Save the modified document
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the modified document and check replacements
-        modified_doc = Document(output_path)
-        
-        # Check that uppercase versions are present
-        content = " ".join([p.text for p in modified_doc.paragraphs] + 
-                         [cell.text for table in modified_doc.tables for row in table.rows for cell in row.cells])
-        
-        assert "ITEM 1" in content
-        assert "ITEM 2" in content
-    finally:
-        # Clean up
-        os.unlink(output_path)
-
-
-def test_replace_in_tables(sample_document):
+    output_path = str(tmp_path / "modified.docx")
+    doc.save(output_path)
+    
+    # Load the modified document and check replacements
+    modified_doc = Document(output_path)
+    
+    # Check that uppercase versions are present
+    assert _contains(modified_doc, "ITEM 1")
+    assert _contains(modified_doc, "ITEM 2")
+
+
+def test_replace_in_tables(sample_document, tmp_path):
     """Test replacing text in table cells."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Replace text only in tables
     replacements = replace_text(doc, "item", "product", include_tables=True, case_sensitive=False)
@@ -282,27 +271,20 @@ def test_replace_in_tables(sample_document):
     assert replacements > 0
     
     # Save the modified document
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the modified document and check replacements in tables
-        modified_doc = Document(output_path)
-        
-        # Check table content
-        table_text = " ".join([cell.text for table in modified_doc.tables for row in table.rows for cell in row.cells])
-        assert "Product 1" in table_text
-        assert "Product 2" in table_text
-    finally:
-        # Clean up
-        os.unlink(output_path)
-
-
-def test_multiple_replacements(sample_document):
+    output_path = str(tmp_path / "modified.docx")
+    doc.save(output_path)
+    
+    # Load the modified document and check replacements in tables
+    modified_doc = Document(output_path)
+    
+    # Check table content
+    assert _contains(modified_doc, "Product 1", include_paragraphs=False)
+    assert _contains(modified_doc, "Product 2", include_paragraphs=False)
+
+
+def test_multiple_replacements(sample_document, tmp_path):
     """Test multiple sequential replacements on the same document."""
-    # Load the document
-    doc = Document(sample_document)
+    doc = sample_document
     
     # Perform multiple replacements
     replace1 = replace_text(doc, "example", "instance")
@@ -315,33 +297,28 @@ def test_multiple_replacements(sample_document):
     assert replace3 > 0
     
     # Save the modified document
-    with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-        output_path = tmp.name
-        doc.save(output_path)
-    
-    try:
-        # Load the modified document
-        modified_doc = Document(output_path)
-        
-        # "example" should be replaced with "case" after two replacements
-        example_count = find_all_text(modified_doc, "example", case_sensitive=False)
-        assert example_count == 0
-        
-        instance_count = find_all_text(modified_doc, "instance", case_sensitive=False)
-        assert instance_count == 0
-        
-        case_count = find_all_text(modified_doc, "case", case_sensitive=False)
-        assert case_count >= replace1
-        
-        # "sample" should be replaced with "test"
-        sample_count = find_all_text(modified_doc, "sample", case_sensitive=False)
-        assert sample_count == 0
-        
-        test_count = find_all_text(modified_doc, "test", case_sensitive=False)
-        assert test_count >= replace3
-    finally:
-        # Clean up
-        os.unlink(output_path)
+    output_path = str(tmp_path / "modified.docx")
+    doc.save(output_path)
+    
+    # Load the modified document
+    modified_doc = Document(output_path)
+    
+    # "example" should be replaced with "case" after two replacements
+    example_count = find_all_text(modified_doc, "example", case_sensitive=False)
+    assert example_count == 0
+    
+    instance_count = find_all_text(modified_doc, "instance", case_sensitive=False)
+    assert instance_count == 0
+    
+    case_count = find_all_text(modified_doc, "case", case_sensitive=False)
+    assert case_count >= replace1
+    
+    # "sample" should be replaced with "test"
+    sample_count = find_all_text(modified_doc, "sample", case_sensitive=False)
+    assert sample_count == 0
+    
+    test_count = find_all_text(modified_doc, "test", case_sensitive=False)
+    assert test_count >= replace3
 
 
 if __name__ == '__main__':